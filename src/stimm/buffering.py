@@ -25,12 +25,35 @@ class TextBufferingStrategy:
     PUNCTUATION = ".!?;:"
 
     def __init__(self, level: BufferingLevel = "MEDIUM") -> None:
-        self.level = level
         self._buffer = ""
+        self.level = level
+
+    @property
+    def level(self) -> BufferingLevel:
+        """Current buffering level. May be changed between tokens."""
+        return self._level
+
+    @level.setter
+    def level(self, level: BufferingLevel) -> None:
+        self._level = level
+        # Text buffered under the previous level was never checked against
+        # this level's boundaries, so the next feed() must scan all of it.
+        self._rescan = True
 
     def feed(self, token: str) -> str | None:
-        """Feed an LLM token. Returns text to send to TTS, or ``None`` if still buffering."""
+        """Feed an LLM token. Returns text to send to TTS, or ``None`` if still buffering.
+
+        Boundary checks only look at the incoming *token*: anything already
+        buffered was checked on a previous call and did not trigger a flush,
+        so rescanning the whole buffer per token would be wasted work. The
+        one exception is the first token after :attr:`level` changes.
+        """
         self._buffer += token
+        # The text that may contain a boundary not yet acted on.
+        scan = token
+        if self._rescan:
+            self._rescan = False
+            scan = self._buffer
 
         if self.level == "NONE":
             result = self._buffer
@@ -38,7 +61,7 @@ class TextBufferingStrategy:
             return result
 
         if self.level == "LOW":
-            if " " in self._buffer:
+            if " " in scan:
                 # Split at the last space — emit everything before it,
                 # keep the partial word after it in the buffer.
                 head, tail = self._buffer.rsplit(" ", 1)
@@ -46,21 +69,25 @@ class TextBufferingStrategy:
                 return head + " "
 
         elif self.level == "MEDIUM":
-            words = self._buffer.split()
-            has_punctuation = any(c in self._buffer for c in self.PUNCTUATION)
-            if len(words) >= 4 or has_punctuation:
+            # maxsplit=3 caps the split at four items — enough to tell
+            # whether the 4-word threshold is reached.
+            has_four_words = len(self._buffer.split(None, 3)) >= 4
+            if has_four_words or self._has_punctuation(scan):
                 result = self._buffer
                 self._buffer = ""
                 return result
 
         elif self.level == "HIGH":
-            if any(c in self._buffer for c in self.PUNCTUATION):
+            if self._has_punctuation(scan):
                 result = self._buffer
                 self._buffer = ""
                 return result
 
         return None
 
+    def _has_punctuation(self, text: str) -> bool:
+        return any(c in text for c in self.PUNCTUATION)
+
     def flush(self) -> str | None:
         """Flush any remaining buffer content (call at end of LLM stream)."""
         if self._buffer:
@@ -71,7 +71,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 
-from stimm.protocol import BeforeSpeakMessage, StateMessage, TranscriptMessage
+from stimm.protocol import BeforeSpeakMessage, StateMessage, TranscriptMessage, now_ms
 from stimm.supervisor import Supervisor
 
 logger = logging.getLogger("stimm.conversation_supervisor")
@@ -79,6 +79,13 @@ logger = logging.getLogger("stimm.conversation_supervisor")
 # Sentinel: backend returns this to indicate "nothing to say this turn".
 _NO_ACTION = "[NO_ACTION]"
 
+# Speaker labels used by :meth:`ConversationSupervisor.format_history`.
+_SUPERVISOR_PREFIX = "--Supervisor--"
+_ROLE_PREFIXES = {"user": "User", "assistant": "Assistant"}
+
+# Compact, non-ASCII-preserving encoder for OBS_JSON log lines.
+_OBS_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 
 class _Turn:
     __slots__ = ("role", "text")
@@ -184,6 +191,8 @@ class ConversationSupervisor(Supervisor, ABC):
         )
 
         self._history: list[_Turn] = []
+        # Most recent turn per role still inside the history window.
+        self._last_turn_by_role: dict[str, _Turn] = {}
         self._last_turn_ts: float = 0.0
         # Index of the first entry not yet forwarded to the backend.
         self._processed_up_to: int = 0
@@ -231,11 +240,11 @@ class ConversationSupervisor(Supervisor, ABC):
         if not text:
             return
         # Deduplicate consecutive identical final transcripts.
-        last_user = next((t for t in reversed(self._history) if t.role == "user"), None)
+        last_user = self._last_turn_by_role.get("user")
         if last_user is not None and last_user.text.strip() == text:
-            logger.info("[SUPERVISOR] DEDUP DROP user transcript=%r", text[:80])
+            logger.debug("[SUPERVISOR] DEDUP DROP user transcript=%r", text[:80])
             return
-        logger.info(
+        logger.debug(
             "[SUPERVISOR] ACCEPT user transcript=%r (history_len=%d)", text[:80], len(self._history)
         )
         self._push("user", text)
@@ -268,11 +277,7 @@ class ConversationSupervisor(Supervisor, ABC):
         unprocessed = self._history[self._processed_up_to :]
         if not any(t.role == "user" for t in unprocessed):
             return
-        self._processing = True
-        try:
-            await self._process()
-        finally:
-            self._processing = False
+        await self._process_exclusive()
 
     def _build_instant_feedback_context(self, latest_user_text: str) -> str:
         excerpt = latest_user_text.strip().replace("\n", " ")
@@ -301,7 +306,7 @@ class ConversationSupervisor(Supervisor, ABC):
         return context
 
     def _latest_assistant_excerpt(self) -> str | None:
-        last_assistant = next((t for t in reversed(self._history) if t.role == "assistant"), None)
+        last_assistant = self._last_turn_by_role.get("assistant")
         if last_assistant is None:
             return None
         excerpt = last_assistant.text.strip().replace("\n", " ")
@@ -312,20 +317,30 @@ class ConversationSupervisor(Supervisor, ABC):
         return excerpt
 
     def _emit_observability_event(self, event: str, **fields: object) -> None:
+        # Skip building and serializing the payload when it would be dropped.
+        if not logger.isEnabledFor(logging.INFO):
+            return
         payload: dict[str, object] = {
             "component": "conversation_supervisor",
             "event": event,
-            "ts_ms": _now_ms(),
+            "ts_ms": now_ms(),
             "inference_seq": self._inference_seq,
         }
         payload.update(fields)
-        logger.info("OBS_JSON %s", json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        logger.info("OBS_JSON %s", _OBS_ENCODER.encode(payload))
 
     def _push(self, role: str, text: str) -> None:
-        self._history.append(_Turn(role, text))
+        turn = _Turn(role, text)
+        self._history.append(turn)
+        self._last_turn_by_role[role] = turn
         if len(self._history) > self.max_turns:
             removed = len(self._history) - self.max_turns
-            self._history = self._history[-self.max_turns :]
+            for old in self._history[:removed]:
+                if self._last_turn_by_role.get(old.role) is old:
+                    del self._last_turn_by_role[old.role]
+            # Trim in place: the window is full on every push once warmed up,
+            # so rebuilding the list would copy ``max_turns`` entries each time.
+            del self._history[:removed]
             self._processed_up_to = max(0, self._processed_up_to - removed)
         if role in ("user", "assistant"):
             self._last_turn_ts = time.monotonic()
@@ -335,15 +350,9 @@ class ConversationSupervisor(Supervisor, ABC):
 
         Override to customise the format sent to the backend.
         """
-        lines: list[str] = []
-        for t in self._history:
-            if t.role == "user":
-                lines.append(f"User: {t.text}")
-            elif t.role == "assistant":
-                lines.append(f"Assistant: {t.text}")
-            else:
-                lines.append(f"--Supervisor--: {t.text}")
-        return "\n".join(lines)
+        return "\n".join(
+            f"{_ROLE_PREFIXES.get(t.role, _SUPERVISOR_PREFIX)}: {t.text}" for t in self._history
+        )
 
     def get_backend_system_prompt(self) -> str | None:
         """Return backend system prompt for the supervisor reasoning backend."""
@@ -405,6 +414,14 @@ class ConversationSupervisor(Supervisor, ABC):
             return
         if self._processing:
             return
+        await self._process_exclusive()
+
+    async def _process_exclusive(self) -> None:
+        """Run :meth:`_process` while holding the ``_processing`` flag.
+
+        Shared by the background tick and the immediate post-transcript path
+        so both respect the same single-inference guard.
+        """
         self._processing = True
         try:
             await self._process()
@@ -457,7 +474,3 @@ class ConversationSupervisor(Supervisor, ABC):
             text_chars=len(decision.text),
             preview=decision.text[:120],
         )
-
-
-def _now_ms() -> int:
-    return int(time.time() * 1000)
@@ -7,17 +7,23 @@ over a LiveKit reliable data channel.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
 from collections.abc import Callable, Coroutine
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, get_args
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 logger = logging.getLogger("stimm.protocol")
 
 STIMM_TOPIC = "stimm"
 
+
+def now_ms() -> int:
+    """Current wall-clock time in milliseconds, as used for message timestamps."""
+    return int(time.time() * 1000)
+
+
 # ---------------------------------------------------------------------------
 # VoiceAgent → Supervisor messages
 # ---------------------------------------------------------------------------
@@ -128,18 +134,20 @@ StimmMessage = (
     | OverrideMessage
 )
 
+# Derived from the union so the registry and the inbound parser below can
+# never disagree about which message types exist.
 _MESSAGE_TYPES: dict[str, type[BaseModel]] = {
-    "transcript": TranscriptMessage,
-    "state": StateMessage,
-    "before_speak": BeforeSpeakMessage,
-    "metrics": MetricsMessage,
-    "instruction": InstructionMessage,
-    "context": ContextMessage,
-    "action_result": ActionResultMessage,
-    "mode": ModeMessage,
-    "override": OverrideMessage,
+    cls.model_fields["type"].default: cls for cls in get_args(StimmMessage)
 }
 
+# Discriminated on ``type`` so pydantic-core parses and validates inbound
+# JSON in a single pass, without building an intermediate dict.
+_MESSAGE_ADAPTER: TypeAdapter[StimmMessage] = TypeAdapter(
+    Annotated[StimmMessage, Field(discriminator="type")]
+)
+
+_UNKNOWN_TAG_ERRORS = frozenset({"union_tag_invalid", "union_tag_not_found"})
+
 # Callback type for message handlers
 MessageHandler = Callable[..., Coroutine[Any, Any, None]]
 
@@ -160,6 +168,9 @@ class StimmProtocol:
     def __init__(self) -> None:
         self._handlers: dict[str, list[MessageHandler]] = {}
         self._room: Any | None = None  # livekit.rtc.Room (lazy import)
+        # Strong references to in-flight handler tasks: the event loop only
+        # keeps weak ones, so an unreferenced task can be collected mid-run.
+        self._tasks: set[asyncio.Future[None]] = set()
 
     def bind(self, room: Any) -> None:
         """Bind to a LiveKit room's data channel.
@@ -175,23 +186,32 @@ class StimmProtocol:
         """Handle incoming data channel packet."""
         if getattr(data, "topic", None) != STIMM_TOPIC:
             return
+        if not self._handlers:
+            # Nothing registered yet — skip parsing and validation entirely.
+            return
 
         try:
-            raw = data.data if isinstance(data.data, bytes) else data.data.encode()
-            payload = json.loads(raw)
-            msg_type = payload.get("type")
-            cls = _MESSAGE_TYPES.get(msg_type)  # type: ignore[arg-type]
-            if cls is None:
+            # validate_json accepts str, bytes and bytearray as-is.
+            msg = _MESSAGE_ADAPTER.validate_json(data.data)
+        except ValidationError as exc:
+            tag_error = next(
+                (e for e in exc.errors() if e["type"] in _UNKNOWN_TAG_ERRORS),
+                None,
+            )
+            if tag_error is not None:
+                msg_type = (tag_error.get("ctx") or {}).get("tag")
                 logger.warning("Unknown stimm message type: %s", msg_type)
-                return
-            msg = cls.model_validate(payload)
+            else:
+                logger.exception("Failed to deserialize stimm message")
+            return
         except Exception:
             logger.exception("Failed to deserialize stimm message")
             return
 
-        handlers = self._handlers.get(msg_type, [])  # type: ignore[arg-type]
-        for handler in handlers:
-            asyncio.ensure_future(handler(msg))
+        for handler in self._handlers.get(msg.type, ()):
+            task = asyncio.ensure_future(handler(msg))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
 
     # -- Registration helpers ------------------------------------------------
 
@@ -231,7 +251,9 @@ class StimmProtocol:
         if not self._room:
             logger.warning("Cannot send — protocol not bound to a room")
             return
-        payload = msg.model_dump_json().encode()
+        # Serialize straight to UTF-8 bytes. ``model_dump_json()`` decodes the
+        # serializer output to str, which would then be re-encoded here.
+        payload = msg.__pydantic_serializer__.to_json(msg)
         await self._room.local_participant.publish_data(
             payload,
             topic=STIMM_TOPIC,
@@ -33,23 +33,41 @@ def load_runtime_contract() -> dict[str, Any]:
     return json.loads(data)
 
 
+def _index_runtime_contract(
+    contract: dict[str, Any],
+) -> dict[str, dict[str, dict[str, Any] | None]]:
+    """Build a ``kind -> {id or alias -> entry}`` lookup table for *contract*.
+
+    Aliases take precedence over ids, matching the resolution order of
+    :func:`resolve_runtime_provider`. An alias whose target is unknown maps
+    to ``None``.
+    """
+    index: dict[str, dict[str, dict[str, Any] | None]] = {}
+    all_aliases = contract.get("aliases", {})
+    for kind in PROVIDER_KINDS:
+        entries = contract.get(kind, [])
+        if not isinstance(entries, list):
+            continue
+        by_id: dict[str, dict[str, Any] | None] = {}
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("id"), str):
+                by_id.setdefault(entry["id"], entry)
+        lookup = dict(by_id)
+        aliases = all_aliases.get(kind, {}) if isinstance(all_aliases, dict) else {}
+        if isinstance(aliases, dict):
+            for alias, target in aliases.items():
+                lookup[alias] = by_id.get(target)
+        index[kind] = lookup
+    return index
+
+
 def resolve_runtime_provider(kind: str, provider_id: str) -> dict[str, Any] | None:
     """Resolve a runtime provider entry for *kind* and *provider_id*.
 
-    Applies aliases defined in ``providers_runtime.json``.
+    Applies aliases defined in ``providers_runtime.json``. Lookups go through
+    a table built once at import time instead of scanning the contract.
     """
-    entries = RUNTIME_CONTRACT.get(kind, [])
-    if not isinstance(entries, list):
-        return None
-
-    aliases = RUNTIME_CONTRACT.get("aliases", {}).get(kind, {})
-    if isinstance(aliases, dict):
-        provider_id = aliases.get(provider_id, provider_id)
-
-    for entry in entries:
-        if isinstance(entry, dict) and entry.get("id") == provider_id:
-            return entry
-    return None
+    return _RUNTIME_INDEX.get(kind, {}).get(provider_id)
 
 
 def get_provider_catalog() -> dict[str, Any]:
@@ -140,3 +158,4 @@ def extras_install_command(
 
 CATALOG: dict[str, Any] = load_catalog()
 RUNTIME_CONTRACT: dict[str, Any] = load_runtime_contract()
+_RUNTIME_INDEX = _index_runtime_contract(RUNTIME_CONTRACT)
@@ -24,7 +24,7 @@ _INTERNAL_PREFIXES: tuple[str, ...] = ("stimm-", "agent_")
 
 def _is_internal(identity: str) -> bool:
     """Return True if the identity belongs to an internal agent."""
-    return any(identity.startswith(p) for p in _INTERNAL_PREFIXES)
+    return identity.startswith(_INTERNAL_PREFIXES)
 
 
 class StimmRoom:
@@ -77,6 +77,7 @@ class StimmRoom:
         inactivity_timeout_s: int = 600,
     ) -> None:
         self._url = livekit_url
+        self._http_url = livekit_url.replace("ws://", "http://").replace("wss://", "https://")
         self._api_key = api_key
         self._api_secret = api_secret
         self._voice_agent = voice_agent
@@ -108,9 +109,8 @@ class StimmRoom:
         """Return a configured LiveKitAPI instance (caller must ``aclose()`` it)."""
         from livekit import api as lkapi
 
-        http_url = self._url.replace("ws://", "http://").replace("wss://", "https://")
         return lkapi.LiveKitAPI(
-            url=http_url,
+            url=self._http_url,
             api_key=self._api_key,
             api_secret=self._api_secret,
         )
@@ -206,23 +206,9 @@ class StimmRoom:
                 logger.warning("Could not list participants for room %s: %s", self._room_name, exc)
                 participants = []
 
-            # Remove each participant so they receive a proper disconnect event
-            for p in participants:
-                try:
-                    await lk.room.remove_participant(
-                        lkapi.RoomParticipantIdentity(
-                            room=self._room_name,
-                            identity=p.identity,
-                        )
-                    )
-                    logger.info("Ejected participant %s from room %s", p.identity, self._room_name)
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to eject participant %s from room %s: %s",
-                        p.identity,
-                        self._room_name,
-                        exc,
-                    )
+            # Remove each participant so they receive a proper disconnect event.
+            # Removals are independent, so issue them concurrently.
+            await asyncio.gather(*(self._eject_participant(lk, p.identity) for p in participants))
 
             # 4. Delete the room
             try:
@@ -236,6 +222,23 @@ class StimmRoom:
         self._started = False
         logger.info("StimmRoom stopped: %s", self._room_name)
 
+    async def _eject_participant(self, lk: Any, identity: str) -> None:
+        """Remove one participant from the room, logging (not raising) on failure."""
+        from livekit import api as lkapi
+
+        try:
+            await lk.room.remove_participant(
+                lkapi.RoomParticipantIdentity(room=self._room_name, identity=identity)
+            )
+            logger.info("Ejected participant %s from room %s", identity, self._room_name)
+        except Exception as exc:
+            logger.warning(
+                "Failed to eject participant %s from room %s: %s",
+                identity,
+                self._room_name,
+                exc,
+            )
+
     # -- Inactivity watchdog -------------------------------------------------
 
     async def _inactivity_watchdog(self) -> None:
@@ -249,8 +252,9 @@ class StimmRoom:
             return
 
         lk_room = self._supervisor.room
+        loop = asyncio.get_running_loop()
         _human_count = 0
-        _last_departure: float = asyncio.get_event_loop().time()
+        _last_departure: float = loop.time()
 
         def _on_connected(participant: Any) -> None:
             nonlocal _human_count, _last_departure
@@ -268,7 +272,7 @@ class StimmRoom:
             if not _is_internal(participant.identity):
                 _human_count = max(0, _human_count - 1)
                 if _human_count == 0:
-                    _last_departure = asyncio.get_event_loop().time()
+                    _last_departure = loop.time()
                     logger.info(
                         "Room %s: last human participant left (%s), inactivity timer started (%ds)",
                         self._room_name,
@@ -285,7 +289,7 @@ class StimmRoom:
                 await asyncio.sleep(check_interval)
                 if _human_count > 0:
                     continue
-                elapsed = asyncio.get_event_loop().time() - _last_departure
+                elapsed = loop.time() - _last_departure
                 if elapsed >= self._inactivity_timeout_s:
                     logger.info(
                         "Room %s: inactivity timeout reached (%.0fs), shutting down",
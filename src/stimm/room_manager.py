@@ -24,17 +24,14 @@ Example::
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Callable
-from typing import TYPE_CHECKING
 
 from stimm.room import StimmRoom
 from stimm.supervisor import Supervisor
 from stimm.voice_agent import VoiceAgent
 
-if TYPE_CHECKING:
-    pass
-
 logger = logging.getLogger("stimm.room_manager")
 
 
@@ -150,8 +147,9 @@ class RoomManager:
     async def stop_all(self) -> None:
         """Stop all managed sessions."""
         room_names = list(self._sessions.keys())
-        for room_name in room_names:
-            await self.end_session(room_name)
+        # Sessions are independent and end_session never raises, so tear
+        # them down concurrently rather than one room after another.
+        await asyncio.gather(*(self.end_session(name) for name in room_names))
         logger.info("All voice sessions stopped (%d total)", len(room_names))
 
     # -- Queries -------------------------------------------------------------
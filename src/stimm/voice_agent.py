@@ -24,6 +24,7 @@ from stimm.protocol import (
     StateMessage,
     StimmProtocol,
     TranscriptMessage,
+    now_ms,
 )
 
 logger = logging.getLogger("stimm.voice_agent")
@@ -47,7 +48,8 @@ class VoiceAgent(Agent):
         buffering_level: Pre-TTS buffering aggressiveness.
         mode: Initial operating mode.
         supervisor_instructions_window: How many recent supervisor instructions
-            to keep in the LLM context window.
+            to keep in the LLM context window. Also bounds how many appended
+            context entries are retained.
     """
 
     def __init__(
@@ -141,7 +143,7 @@ class VoiceAgent(Agent):
             TranscriptMessage(
                 partial=partial,
                 text=text,
-                timestamp=_now_ms(),
+                timestamp=now_ms(),
                 confidence=confidence,
             )
         )
@@ -149,7 +151,7 @@ class VoiceAgent(Agent):
     async def publish_state(self, state: str) -> None:
         """Publish a state change (listening / thinking / speaking)."""
         await self._protocol.send_state(
-            StateMessage(state=state, timestamp=_now_ms())  # type: ignore[arg-type]
+            StateMessage(state=state, timestamp=now_ms())  # type: ignore[arg-type]
         )
 
     async def publish_before_speak(self, text: str) -> str:
@@ -193,6 +195,9 @@ class VoiceAgent(Agent):
         """Process context from the supervisor."""
         if msg.append:
             self._supervisor_context.append(msg.text)
+            # Only the latest entry reaches the prompt; keep a bounded tail so
+            # long sessions with append-mode context do not grow without limit.
+            del self._supervisor_context[: -max(1, self._instructions_window)]
         else:
             self._supervisor_context = [msg.text]
         logger.debug("Context updated: %d entries", len(self._supervisor_context))
@@ -278,7 +283,7 @@ class VoiceAgent(Agent):
     async def _generate_reply_from_current_context(self) -> None:
         """Force a fast-LLM turn from the currently injected context (idle trigger path)."""
         if self._reply_trigger_inflight:
-            logger.info("[VOICE_AGENT] generate_reply SKIPPED (inflight)")
+            logger.debug("[VOICE_AGENT] generate_reply SKIPPED (inflight)")
             return
         session = self._current_session()
         if session is None:
@@ -402,8 +407,3 @@ class VoiceAgent(Agent):
     def flush_buffer(self) -> str | None:
         """Flush any remaining buffered text (call at end of LLM stream)."""
         return self._buffering.flush()
-
-
-def _now_ms() -> int:
-    """Current time in milliseconds."""
-    return int(time.time() * 1000)
@@ -60,10 +60,14 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import functools
 import importlib
 import logging
 import os
+import re
+import time
 from collections.abc import Callable
+from datetime import timedelta
 from typing import Any
 
 from livekit.agents import AgentSession, JobContext
@@ -74,6 +78,25 @@ from stimm.voice_agent import VoiceAgent
 
 logger = logging.getLogger("stimm.worker")
 
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+# TTS constructor keyword that takes STIMM_TTS_VOICE, when it is not ``voice``.
+# Hume is handled separately (it needs a VoiceById/VoiceByName object).
+_TTS_VOICE_KWARGS: dict[str, str] = {
+    "elevenlabs": "voice_id",
+    "neuphonic": "voice_id",
+    "smallestai": "voice_id",
+    "speechify": "voice_id",
+    "resemble": "voice_uuid",
+    "google": "voice_name",
+    "gemini": "voice_name",
+    # rime.TTS uses speaker= not voice=
+    "rime": "speaker",
+}
+
 
 def _runtime_ids(kind: str) -> list[str]:
     entries = RUNTIME_CONTRACT.get(kind, [])
@@ -90,11 +113,17 @@ def _runtime_ids(kind: str) -> list[str]:
     return sorted(ids)
 
 
-def _load_plugin(kind: str, provider: str) -> Any:
+def _resolve_plugin(kind: str, provider: str) -> dict[str, Any]:
     resolved = resolve_runtime_provider(kind, provider)
     if not resolved:
         available = ", ".join(_runtime_ids(kind))
         raise ValueError(f"Unknown provider '{provider}' for {kind}. Available: {available}")
+    return resolved
+
+
+def _load_plugin(kind: str, provider: str, resolved: dict[str, Any] | None = None) -> Any:
+    if resolved is None:
+        resolved = _resolve_plugin(kind, provider)
 
     module_name = resolved.get("module")
     if not isinstance(module_name, str) or not module_name:
@@ -114,6 +143,13 @@ def _load_plugin(kind: str, provider: str) -> Any:
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _load_vad() -> Any:
+    # Silero's model weights are immutable and each session opens its own
+    # stream, so one loaded VAD can serve every job in the worker process.
+    return silero.VAD.load()
+
+
 def _make_stt() -> Any:
     provider = os.environ.get("STIMM_STT_PROVIDER", "deepgram")
     model = os.environ.get("STIMM_STT_MODEL", "nova-3")
@@ -151,12 +187,9 @@ def _make_tts() -> Any:
     voice = os.environ.get("STIMM_TTS_VOICE", "ash")
     language = os.environ.get("STIMM_TTS_LANGUAGE")
     api_key = os.environ.get("STIMM_TTS_API_KEY")
-    resolved = resolve_runtime_provider("tts", provider)
-    if not resolved:
-        available = ", ".join(_runtime_ids("tts"))
-        raise ValueError(f"Unknown provider '{provider}' for tts. Available: {available}")
+    resolved = _resolve_plugin("tts", provider)
     provider_id = resolved["id"]
-    mod = _load_plugin("tts", provider)
+    mod = _load_plugin("tts", provider, resolved)
 
     kwargs: dict[str, Any] = {}
     tts_ctor = mod.TTS
@@ -178,31 +211,16 @@ def _make_tts() -> Any:
 
     # Mapping de la voix
     if voice:
-        if provider_id in {"elevenlabs", "neuphonic", "smallestai", "speechify"}:
-            kwargs["voice_id"] = voice
-        elif provider_id == "resemble":
-            kwargs["voice_uuid"] = voice
-        elif provider_id in {"google", "gemini"}:
-            kwargs["voice_name"] = voice
-        elif provider_id == "rime":
-            # rime.TTS uses speaker= not voice=
-            kwargs["speaker"] = voice
-        elif provider_id == "hume":
+        if provider_id == "hume":
             # Hume requires VoiceById (UUID) or VoiceByName, not a plain string
-            import re as _re
-
             from livekit.plugins.hume import VoiceById, VoiceByName
 
-            if _re.match(
-                r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                voice,
-                _re.IGNORECASE,
-            ):
+            if _UUID_RE.match(voice):
                 kwargs["voice"] = VoiceById(id=voice)
             else:
                 kwargs["voice"] = VoiceByName(name=voice)
         else:
-            kwargs["voice"] = voice
+            kwargs[_TTS_VOICE_KWARGS.get(provider_id, "voice")] = voice
 
     # Hume specific parameters
     if provider_id == "hume":
@@ -277,7 +295,7 @@ def make_agent(instructions: str | None = None) -> VoiceAgent:
     return VoiceAgent(
         stt=_make_stt(),
         tts=_make_tts(),
-        vad=silero.VAD.load(),
+        vad=_load_vad(),
         fast_llm=_make_llm(),
         buffering_level=os.environ.get("STIMM_BUFFERING", "MEDIUM"),  # type: ignore[arg-type]
         mode=os.environ.get("STIMM_MODE", "hybrid"),  # type: ignore[arg-type]
@@ -334,10 +352,8 @@ def make_entrypoint(
         # Re-apply INFO level on stimm.* loggers here, after livekit-agents has
         # finished its own logging setup (which runs before entrypoint is called
         # and can reset levels set in basicConfig / module-level code).
-        import logging as _logging
-
         for _n in ("stimm", "openclaw"):
-            _logging.getLogger(_n).setLevel(_logging.INFO)
+            logging.getLogger(_n).setLevel(logging.INFO)
 
         agent = make_agent()
         session = AgentSession()
@@ -354,27 +370,30 @@ def make_entrypoint(
 
         @session.on("user_input_transcribed")
         def _on_transcript(ev) -> None:  # type: ignore[no-untyped-def]
-            import time
-
             is_final = bool(ev.is_final)
             text: str = ev.transcript or ""
-            logger.info(
-                "[TRANSCRIPT] is_final=%s text=%r agent_state=%s current_speech=%s",
-                is_final,
-                text,
-                getattr(session, "agent_state", "?"),
-                getattr(session, "current_speech", None) is not None,
-            )
+            # Partials fire many times per utterance: keep them at DEBUG and
+            # skip building the log arguments unless DEBUG is enabled.
+            log_level = logging.INFO if is_final else logging.DEBUG
+            if logger.isEnabledFor(log_level):
+                logger.log(
+                    log_level,
+                    "[TRANSCRIPT] is_final=%s text=%r agent_state=%s current_speech=%s",
+                    is_final,
+                    text,
+                    getattr(session, "agent_state", "?"),
+                    getattr(session, "current_speech", None) is not None,
+                )
             if is_final:
                 now = time.monotonic()
                 if text == _last_final[0] and now - _last_final[1] < _FINAL_DEDUP_WINDOW_S:
-                    logger.info(
+                    logger.debug(
                         "[TRANSCRIPT] DEDUP DROP final=%r (%.3fs ago)", text, now - _last_final[1]
                     )
                     return
                 _last_final[0] = text
                 _last_final[1] = now
-                logger.info("[TRANSCRIPT] PASS final=%r → publish_transcript", text)
+                logger.debug("[TRANSCRIPT] PASS final=%r → publish_transcript", text)
             asyncio.ensure_future(agent.publish_transcript(text, partial=not is_final))
 
         @session.on("conversation_item_added")
@@ -404,8 +423,6 @@ def make_entrypoint(
         api_key = os.environ.get("LIVEKIT_API_KEY", "devkey")
         api_secret = os.environ.get("LIVEKIT_API_SECRET", "secret")
 
-        from datetime import timedelta
-
         from livekit import api as lkapi
 
         sup_token = (
@@ -46,6 +46,12 @@ class TestBufferingMedium:
         result = buf.feed(".")
         assert result == "Hello."
 
+    def test_counts_words_split_across_tokens(self) -> None:
+        buf = TextBufferingStrategy("MEDIUM")
+        for token in ["on", "e t", "wo th", "ree"]:
+            assert buf.feed(token) is None
+        assert buf.feed(" four") == "one two three four"
+
     def test_flush(self) -> None:
         buf = TextBufferingStrategy("MEDIUM")
         buf.feed("short")
@@ -77,3 +83,13 @@ class TestReset:
         buf.feed("something")
         buf.reset()
         assert buf.flush() is None
+
+
+class TestLevelChange:
+    def test_switching_level_rechecks_buffered_text(self) -> None:
+        buf = TextBufferingStrategy("HIGH")
+        assert buf.feed("Hello there") is None
+        buf.level = "LOW"
+        # The space was buffered under HIGH; LOW must still act on it.
+        assert buf.feed("x") == "Hello "
+        assert buf.flush() == "therex"
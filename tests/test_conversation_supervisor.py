@@ -192,3 +192,47 @@ class TestConversationSupervisorContextBoundary:
             assert previous_acks[idx] in ctx
 
         assert len(set(captured)) == len(captured)
+
+
+class TestConversationSupervisorHistoryWindow:
+    def test_push_trims_oldest_turns_and_shifts_processed_index(self) -> None:
+        sup = _StubConversationSupervisor(max_turns=3)
+        for idx in range(3):
+            sup._push("user", f"turn {idx}")
+        sup._processed_up_to = 3
+
+        sup._push("assistant", "turn 3")
+        sup._push("user", "turn 4")
+
+        assert [turn.text for turn in sup._history] == ["turn 2", "turn 3", "turn 4"]
+        assert sup._processed_up_to == 1
+
+    def test_last_turn_by_role_follows_the_window(self) -> None:
+        sup = _StubConversationSupervisor(max_turns=2)
+        sup._push("assistant", "hello")
+        sup._push("user", "hi")
+        assert sup._latest_assistant_excerpt() == "hello"
+        sup._push("user", "again")
+        # The only assistant turn has been trimmed out of the window.
+        assert sup._latest_assistant_excerpt() is None
+        assert sup._last_turn_by_role["user"].text == "again"
+
+    def test_format_history_labels_each_role(self) -> None:
+        sup = _StubConversationSupervisor()
+        sup._push("user", "hi")
+        sup._push("assistant", "hello")
+        sup._push("supervisor", "be brief")
+        assert sup.format_history() == "User: hi\nAssistant: hello\n--Supervisor--: be brief"
+
+
+class TestConversationSupervisorObservability:
+    def test_obs_json_is_compact_and_keeps_non_ascii(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        sup = _StubConversationSupervisor()
+        with caplog.at_level("INFO", logger="stimm.conversation_supervisor"):
+            sup._emit_observability_event("trigger_sent", preview="Use 22°C")
+        lines = [r.getMessage() for r in caplog.records]
+        line = next(m for m in lines if m.startswith("OBS_JSON"))
+        assert '"event":"trigger_sent"' in line
+        assert '"preview":"Use 22°C"' in line
@@ -1,7 +1,10 @@
 """Tests for the stimm protocol message types and serialization."""
 
+import asyncio
 import json
 
+import pytest
+
 from stimm.protocol import (
     _MESSAGE_TYPES,
     ActionResultMessage,
@@ -135,8 +138,95 @@ class TestStimmProtocol:
         """Sending on an unbound protocol should not raise."""
         proto = StimmProtocol()
         # _send is async but we can check it doesn't crash when unbound
-        import asyncio
-
         asyncio.get_event_loop().run_until_complete(
             proto.send_transcript(TranscriptMessage(partial=True, text="test", timestamp=0))
         )
+
+
+class _Packet:
+    def __init__(self, data: bytes | str, topic: str = "stimm") -> None:
+        self.data = data
+        self.topic = topic
+
+
+class TestInboundDispatch:
+    async def test_dispatches_bytes_and_str_payloads(self) -> None:
+        proto = StimmProtocol()
+        received: list[InstructionMessage] = []
+
+        async def handler(msg: InstructionMessage) -> None:
+            received.append(msg)
+
+        proto.on_instruction(handler)
+        raw = InstructionMessage(text="hello").model_dump_json()
+        proto._on_data(_Packet(raw.encode()))
+        proto._on_data(_Packet(raw))
+        await asyncio.sleep(0)
+
+        assert [m.text for m in received] == ["hello", "hello"]
+
+    async def test_handler_tasks_are_tracked_until_done(self) -> None:
+        proto = StimmProtocol()
+        release = asyncio.Event()
+
+        async def handler(msg: InstructionMessage) -> None:
+            await release.wait()
+
+        proto.on_instruction(handler)
+        proto._on_data(_Packet(InstructionMessage(text="x").model_dump_json()))
+        assert len(proto._tasks) == 1
+
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert proto._tasks == set()
+
+    async def test_ignores_other_topics(self) -> None:
+        proto = StimmProtocol()
+        received: list[InstructionMessage] = []
+
+        async def handler(msg: InstructionMessage) -> None:
+            received.append(msg)
+
+        proto.on_instruction(handler)
+        proto._on_data(_Packet(InstructionMessage(text="x").model_dump_json(), topic="other"))
+        await asyncio.sleep(0)
+
+        assert received == []
+
+    async def test_unknown_type_is_not_dispatched(self, caplog: pytest.LogCaptureFixture) -> None:
+        proto = StimmProtocol()
+        received: list[object] = []
+
+        async def handler(msg: object) -> None:
+            received.append(msg)
+
+        proto.on_instruction(handler)
+        with caplog.at_level("WARNING", logger="stimm.protocol"):
+            proto._on_data(_Packet(b'{"type":"bogus","text":"x"}'))
+        await asyncio.sleep(0)
+
+        assert received == []
+        assert "Unknown stimm message type: bogus" in caplog.text
+
+
+class TestOutboundSerialization:
+    async def test_send_publishes_utf8_json_bytes(self) -> None:
+        published: list[tuple[bytes, str]] = []
+
+        class _Participant:
+            async def publish_data(self, payload: bytes, *, topic: str, reliable: bool) -> None:
+                published.append((payload, topic))
+
+        class _Room:
+            local_participant = _Participant()
+
+            def on(self, *_args: object) -> None:
+                pass
+
+        proto = StimmProtocol()
+        proto.bind(_Room())
+        msg = ContextMessage(text="Température: 22°C")
+        await proto.send_context(msg)
+
+        assert published == [(msg.model_dump_json().encode(), "stimm")]
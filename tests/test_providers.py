@@ -8,6 +8,7 @@ from stimm.providers import (
     list_runtime_providers,
     required_extra_for_provider,
     required_extras_for_selection,
+    resolve_runtime_provider,
 )
 
 
@@ -38,6 +39,17 @@ class TestProviderCatalogHelpers:
         assert "constructor" in providers[0]
 
 
+class TestRuntimeResolution:
+    def test_resolves_alias_to_target_entry(self) -> None:
+        entry = resolve_runtime_provider("llm", "azure-openai")
+        assert entry is not None
+        assert entry["module"] == "livekit.plugins.openai"
+
+    def test_unknown_provider_returns_none(self) -> None:
+        assert resolve_runtime_provider("stt", "does-not-exist") is None
+        assert resolve_runtime_provider("unknown-kind", "openai") is None
+
+
 class TestExtraResolution:
     def test_required_extra_for_alias_provider(self) -> None:
         assert required_extra_for_provider("llm", "google") == "google"
@@ -1,5 +1,7 @@
 """Tests for StimmRoom token generation and lifecycle."""
 
+import pytest
+
 from stimm.room import StimmRoom
 from stimm.voice_agent import VoiceAgent
 
@@ -59,3 +61,78 @@ class TestStimmRoom:
         )
         token = room.get_voice_agent_token()
         assert token.count(".") == 2
+
+
+class _Req:
+    def __init__(self, **kwargs: object) -> None:
+        self.__dict__.update(kwargs)
+
+
+class _FakeRoomService:
+    def __init__(self, participants: tuple[str, ...] = ()) -> None:
+        self.calls: list[str] = []
+        self.room = self
+        self.participants = participants
+        self.removed: list[str] = []
+
+    async def create_room(self, _req: object) -> None:
+        self.calls.append("create_room")
+
+    async def list_participants(self, _req: object) -> object:
+        self.calls.append("list_participants")
+        people = [_Req(identity=identity) for identity in self.participants]
+        return type("_Resp", (), {"participants": people})()
+
+    async def remove_participant(self, req: _Req) -> None:
+        self.calls.append(f"remove_participant:{req.identity}")
+        if req.identity == "broken":
+            raise RuntimeError("boom")
+        self.removed.append(req.identity)
+
+    async def delete_room(self, _req: object) -> None:
+        self.calls.append("delete_room")
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_api_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the livekit.api request types used by StimmRoom with plain records."""
+    from livekit import api as lkapi
+
+    for name in (
+        "CreateRoomRequest",
+        "ListParticipantsRequest",
+        "RoomParticipantIdentity",
+        "DeleteRoomRequest",
+    ):
+        monkeypatch.setattr(lkapi, name, _Req, raising=False)
+
+
+def _make_room() -> StimmRoom:
+    return StimmRoom(
+        livekit_url="ws://localhost:7880",
+        api_key="devkey",
+        api_secret="secret",
+        voice_agent=VoiceAgent(),
+    )
+
+
+@pytest.mark.usefixtures("fake_api_requests")
+class TestStimmRoomStop:
+    async def test_stop_ejects_every_participant_before_deleting(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        room = _make_room()
+        service = _FakeRoomService(participants=("alice", "broken", "bob"))
+        monkeypatch.setattr(room, "_make_room_service", lambda: service)
+
+        await room.start()
+        await room.stop()
+
+        assert sorted(service.removed) == ["alice", "bob"]
+        removals = [i for i, c in enumerate(service.calls) if c.startswith("remove_participant:")]
+        assert len(removals) == 3
+        assert service.calls[-1] == "delete_room"
+        assert max(removals) < service.calls.index("delete_room")
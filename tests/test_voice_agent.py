@@ -101,6 +101,20 @@ class TestRuntimeSync:
         assert "Base prompt" in captured[0]
         assert "--Supervisor--: use metric units" in captured[0]
 
+    @pytest.mark.asyncio
+    async def test_appended_context_is_bounded_by_window(self) -> None:
+        agent = VoiceAgent(instructions="Base prompt", supervisor_instructions_window=2)
+
+        async def fake_update(instructions: str) -> None:
+            return None
+
+        agent.update_instructions = fake_update  # type: ignore[method-assign]
+
+        for idx in range(5):
+            await agent._handle_context(ContextMessage(text=f"ctx {idx}", append=True))
+
+        assert agent._supervisor_context == ["ctx 3", "ctx 4"]
+
     @pytest.mark.asyncio
     async def test_deferred_context_trigger_emits_when_session_becomes_idle(self) -> None:
         agent = VoiceAgent(instructions="Base prompt")